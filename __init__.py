@@ -1,18 +1,5 @@
-from .src.gh_parser import (
-    get_all_repopaths,
-    get_all_repos,
-    get_main_page,
-    get_metadata,
-    get_full_branch,
-    get_path_contents,
-    get_rate_limit,
-    get_repo_stats,
-    parse_config,
-    parse_url,
-    APIParser,
-    ConfigFileParser,
-    GitHubParser
-)
+from importlib import import_module
+
 
 __all__ = (
     "parse_config",
@@ -28,4 +15,18 @@ __all__ = (
     "APIParser",
     "ConfigFileParser",
     "GitHubParser",
-)
\ No newline at end of file
+)
+
+
+def __getattr__(name: str):
+    # Defer to the lazily resolved attributes of `src.gh_parser` (PEP 562).
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(".src.gh_parser", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
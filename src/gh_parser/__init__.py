@@ -1,16 +1,23 @@
-from .utils.parsers import APIParser, ConfigFileParser, GitHubParser
-from .gh_parser import (
-    get_all_repopaths,
-    get_all_repos,
-    get_main_page,
-    get_metadata,
-    get_full_branch,
-    get_path_contents,
-    get_rate_limit,
-    get_repo_stats,
-    parse_config,
-    parse_url,
-)
+from importlib import import_module
+
+
+# Public names are resolved on first access (PEP 562),
+# so importing `gh_parser` does not load the HTTP stack or `configparser`.
+_LAZY_IMPORTS: dict[str, str] = {
+    "parse_config": ".gh_parser",
+    "parse_url": ".gh_parser",
+    "get_rate_limit": ".gh_parser",
+    "get_path_contents": ".gh_parser",
+    "get_metadata": ".gh_parser",
+    "get_main_page": ".gh_parser",
+    "get_repo_stats": ".gh_parser",
+    "get_all_repos": ".gh_parser",
+    "get_all_repopaths": ".gh_parser",
+    "get_full_branch": ".gh_parser",
+    "APIParser": ".utils.parsers",
+    "ConfigFileParser": ".utils.parsers",
+    "GitHubParser": ".utils.parsers",
+}
 
 __all__ = (
     "parse_config",
@@ -26,4 +33,19 @@ __all__ = (
     "APIParser",
     "ConfigFileParser",
     "GitHubParser",
-)
\ No newline at end of file
+)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
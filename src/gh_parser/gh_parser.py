@@ -1,15 +1,25 @@
+import os
+from functools import lru_cache
+from urllib.parse import (
+    parse_qsl as _parse_qsl,
+    urlencode as _urlencode,
+    urlsplit as _urlsplit,
+    urlunsplit as _urlunsplit,
+)
+
+from .utils.fast_cfg import fast_parse
 from .utils.parsers import APIParser, ConfigFileParser, GitHubParser
 from .utils.type_hints import Any, LiteralInt, PathLike, Union
-from .utils.wrappers import func_wrap
-
 
-gh_wrapper = lambda attr: func_wrap(attr, cls_obj=GitHubParser)
+# Parsed configuration files keyed by (path, mtime, size, enhance, parser_only).
+_CFG_CACHE: dict[tuple, Any] = {}
 
 
 # region parse_config
 def parse_config(config_file: PathLike, **kwargs) -> Union[ConfigFileParser, dict]:
     """
     Parse the contents of a configuration file.
+    Results are cached until the file's modification time or size changes.
 
     ### Parameters:
         - `config_file`: The path to the configuration file.
@@ -20,8 +30,32 @@ def parse_config(config_file: PathLike, **kwargs) -> Union[ConfigFileParser, dic
         - The configuration dictionary or the ConfigFileParser
     """
     parser_only = kwargs.pop("parser_only", False)
+    p = os.fspath(config_file)
+
+    try:
+        st = os.stat(p)
+    except OSError:
+        # Let `ConfigFileParser` raise its own `ConfigException`.
+        st = None
+
+    cache_key = None
+    # Only cache when no extra `ConfigParser` options could change the result.
+    if st is not None and not kwargs.keys() - {"enhance"}:
+        cache_key = (
+            os.path.abspath(p),
+            st.st_mtime_ns,
+            st.st_size,
+            kwargs.get("enhance", False),
+        )
+        cached = _CFG_CACHE.get((*cache_key, parser_only))
+        if cached is not None:
+            return cached
+
     cfg = ConfigFileParser(config_file, **kwargs)
-    return [cfg.config, cfg][parser_only]
+    result = cfg if parser_only else cfg.config
+    if cache_key is not None:
+        _CFG_CACHE[(*cache_key, parser_only)] = result
+    return result
 
 
 # ------------------------------------------------------------
@@ -32,17 +66,30 @@ def parse_config(config_file: PathLike, **kwargs) -> Union[ConfigFileParser, dic
 
 
 # region parse_url
-@func_wrap("get_contents", APIParser)
+def _normalize_url(url: str) -> str:
+    parts = _urlsplit("https://" + url.removeprefix("https://"))
+    query = _urlencode(sorted(_parse_qsl(parts.query, keep_blank_values=True)))
+    return _urlunsplit(
+        (parts.scheme, parts.netloc.lower(), parts.path, query, parts.fragment)
+    )
+
+
 def parse_url(**kwargs) -> Any:
     """
     Parse the contents of a URL or API.
+    The URL is normalized first, so equivalent URLs share the TTL and `ETag` based \
+        response cache of `APIParser`.
 
     :param kwargs: The keyword arguments to pass to the APIParser object.
     :type kwargs: dict
     :return: The contents of the URL or API.
     :rtype: Any
     """
-    pass
+    url = kwargs.get("url")
+    if type(url) is str:
+        # Invalid arguments are reported by `APIParser`.
+        kwargs["url"] = _normalize_url(url)
+    return APIParser(**kwargs).get_contents
 
 
 # region get_parser
@@ -86,17 +133,20 @@ def get_path_contents(**kwargs) -> str:
 
 
 # region get_metadata
+@lru_cache(maxsize=2)
 def get_metadata(enhance: bool = True):
     """
     Get the metadata for `gh_parser` from the setup.cfg file.
+    The plain dictionary is read with `fast_parse`, bypassing `ConfigFileParser`.
 
     :param enhance: Whether to enhance the metadata with nested namedtuples.
     :type enhance: bool
     :return: The metadata dictionary.
     :rtype: dict
     """
-    parser = parse_config("setup.cfg", enhance=enhance)
-    return getattr(parser, "metadata", parser["metadata"])
+    if not enhance:
+        return fast_parse("setup.cfg")["metadata"]
+    return parse_config("setup.cfg", enhance=True).metadata
 
 
 # region get_main_page
@@ -114,7 +164,6 @@ def get_main_page(**kwargs):
 
 
 # region get_repo_stats
-@gh_wrapper("full_stats")
 def get_repo_stats(**kwargs) -> dict:
     """
     Get the statistics for a GitHub repository.
@@ -124,11 +173,10 @@ def get_repo_stats(**kwargs) -> dict:
     :return: The statistics for the repository.
     :rtype: dict
     """
-    pass
+    return GitHubParser(**kwargs).full_stats
 
 
 # region get_all_repos
-@gh_wrapper("all_repos")
 def get_all_repos(**kwargs) -> dict:
     """
     Get all the repositories for a GitHub user.
@@ -138,11 +186,10 @@ def get_all_repos(**kwargs) -> dict:
     :return: The repositories for the owner.
     :rtype: dict
     """
-    pass
+    return GitHubParser(**kwargs).all_repos
 
 
 # region get_all_repopaths
-@gh_wrapper("all_repopaths")
 def get_all_repopaths(**kwargs) -> dict:
     """
     Get all the paths (files) for a GitHub repository.
@@ -152,11 +199,10 @@ def get_all_repopaths(**kwargs) -> dict:
     :return: The paths for the repository.
     :rtype: dict
     """
-    pass
+    return GitHubParser(**kwargs).all_repopaths
 
 
 # region get_full_branch
-@gh_wrapper("full_branch")
 def get_full_branch(**kwargs) -> dict:
     """
     Get the full branch data for a GitHub repository.
@@ -166,7 +212,7 @@ def get_full_branch(**kwargs) -> dict:
     :return: The full branch data.
     :rtype: dict
     """
-    pass
+    return GitHubParser(**kwargs).full_branch
 
 
 # endregion
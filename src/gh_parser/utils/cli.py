@@ -1,7 +1,10 @@
+import re
+import sys
 from argparse import ArgumentParser, ArgumentTypeError
+from functools import lru_cache
 
 from .type_hints import Iterable
-from .utils import diff_set, get_parameters
+from .utils import get_parameters
 from ..gh_parser import (
     get_metadata,
     get_main_page,
@@ -16,40 +19,83 @@ from ..gh_parser import (
 )
 
 
-def cli_parser():
-    """The CLI parser for the `gh_parser` package."""
+# Splits '--kwargs' pairs on the first '=' only (values may contain '=').
+_KV_SPLIT = re.compile(r"^([^=]+)=(.*)$", re.DOTALL)
+
+# Valid '--kwargs' keys for `APIParser` ('parse-url') and `GitHubParser`.
+_APIPARSER_PARAMS: frozenset[str] = frozenset(get_parameters(get_parser(0)))
+_GHPARSER_PARAMS: frozenset[str] = frozenset(get_parameters(get_parser(2)))
+
+# Main flags that require the package metadata (setup.cfg) to be read.
+_METADATA_FLAGS: tuple[str, ...] = tuple(
+    map(
+        sys.intern,
+        ("version", "author", "license", "description", "url", "verbose", "metadata"),
+    )
+)
+
+# Single flags answered straight from setup.cfg, without building the parser.
+_FAST_FLAGS: frozenset[str] = frozenset(
+    {"--version", "--author", "--license", "--description", "--url"}
+)
+
+# Sub-command name to function dispatch table.
+_COMMAND_MAPPING: dict = {
+    "main-page": get_main_page,
+    "parse-url": parse_url,
+    "repo-stats": get_repo_stats,
+    "repo-paths": get_all_repopaths,
+    "all-repos": get_all_repos,
+    "full-branch": get_full_branch,
+    "path-contents": get_path_contents,
+}
+# Sub-commands whose '--kwargs' are validated against `APIParser`.
+_PARSE_URL_COMMANDS: frozenset[str] = frozenset({"parse-url"})
+
+
+@lru_cache(maxsize=1)
+def _metadata_keys() -> frozenset[str]:
+    return frozenset(get_metadata(enhance=False)) | {"metadata"}
+
+
+def _add_args(parser):
+    def wrapper(*args, **kwargs):
+        if all(("action" not in kwargs, all(s.startswith("--") for s in args))):
+            kwargs["action"] = "store_true"
+        else:
+            kwargs["type"] = str
+        return parser.add_argument(*args, **kwargs)
+
+    return wrapper
 
-    arg_parser = ArgumentParser(description="GitHub API Parser CLI.")
-    sub_parsers = arg_parser.add_subparsers(dest="command", help="All Command Options.")
 
-    def _add_args(parser):
-        def wrapper(*args, **kwargs):
-            if all(("action" not in kwargs, all(s.startswith("--") for s in args))):
-                kwargs["action"] = "store_true"
-            else:
-                kwargs["type"] = str
-            return parser.add_argument(*args, **kwargs)
-
-        return wrapper
-
-    def _split_kwargs(cls, kwds: Iterable[str]):
-        parser_kwargs = get_parameters(cls)
-        try:
-            fixed_kwds = dict((*k.split("="),) for k in kwds)
-        except TypeError:
-            raise ArgumentTypeError("'--kwargs' must be provided.")
-        except ValueError:
+def _split_kwargs(parser_kwargs: frozenset[str], kwds: Iterable[str]):
+    if not kwds:
+        return {}
+
+    fixed_kwds = {}
+    for kv in kwds:
+        if not (m := _KV_SPLIT.match(kv)):
             raise ArgumentTypeError(
                 "Invalid key-value pair format. Expected 'key=value'."
             )
+        fixed_kwds[m.group(1)] = m.group(2)
 
-        if _bad_kwds := diff_set(fixed_kwds, parser_kwargs):
-            raise ArgumentTypeError(
-                f"Invalid kwarg arguments: {_bad_kwds!r}"
-                f"\nAvailable options: {parser_kwargs!r}"
-            )
+    if _bad_kwds := fixed_kwds.keys() - parser_kwargs:
+        raise ArgumentTypeError(
+            f"Invalid kwarg arguments: {_bad_kwds!r}"
+            f"\nAvailable options: {sorted(parser_kwargs)!r}"
+        )
+
+    return fixed_kwds
 
-        return fixed_kwds
+
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Build the `ArgumentParser` (and all sub-parsers) once per process."""
+
+    arg_parser = ArgumentParser(description="GitHub API Parser CLI.")
+    sub_parsers = arg_parser.add_subparsers(dest="command", help="All Command Options.")
 
     main_args = _add_args(arg_parser)
     main_args("--version", help="Display the current version of 'gh_parser'.")
@@ -92,39 +138,43 @@ def cli_parser():
             ),
         ),
     )
+    return arg_parser
 
+
+def cli_parser():
+    """The CLI parser for the `gh_parser` package."""
+
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in _FAST_FLAGS:
+        return get_metadata(enhance=False).get(argv[0].removeprefix("--"))
+
+    arg_parser = _build_parser()
     args = arg_parser.parse_args()
-    metadata = get_metadata(enhance=False)
-    main_arg_key = next(
-        (k for k, v in vars(args).items() if v and k in (*metadata, "metadata")), None
-    )
 
-    if main_arg_key:
-        return metadata.get(main_arg_key, metadata)
+    if any(getattr(args, k, False) for k in _METADATA_FLAGS):
+        metadata, meta_keys = get_metadata(enhance=False), _metadata_keys()
+        main_arg_key = next(
+            (k for k, v in vars(args).items() if v and k in meta_keys), None
+        )
+
+        if main_arg_key:
+            return metadata.get(main_arg_key, metadata)
 
     command = args.command
-    apiparser, gh_parser = map(get_parser, (0, 2))
 
     if command == "rate-limit":
         return get_rate_limit(key=args.k)
 
-    command_mapping = (
-        ("main-page", get_main_page),
-        ("parse-url", parse_url),
-        ("repo-stats", get_repo_stats),
-        ("repo-paths", get_all_repopaths),
-        ("all-repos", get_all_repos),
-        ("full-branch", get_full_branch),
-        ("path-contents", get_path_contents),
-    )
+    command_function = _COMMAND_MAPPING.get(command)
 
-    other_command = next((k for k in command_mapping if command in k), None)
+    if command_function is None:
+        arg_parser.error(f"Invalid or missing command: {command!r}")
 
-    if other_command:
-        command_key, command_function = other_command
-        parser = (gh_parser, apiparser)[command_key == "parse-url"]
-        fixed_kwargs = _split_kwargs(parser, args.kwargs)
-        return command_function(**fixed_kwargs)
+    parser_kwargs = (_GHPARSER_PARAMS, _APIPARSER_PARAMS)[
+        command in _PARSE_URL_COMMANDS
+    ]
+    fixed_kwargs = _split_kwargs(parser_kwargs, args.kwargs)
+    return command_function(**fixed_kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+import mmap
+import os
+import re
+
+from .exceptions import ConfigException
+from .type_hints import PathLike
+
+
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$", re.M)
+# Keys may not start with whitespace, comments or brackets.
+# Indented lines following a key are treated as continuation lines.
+_KV_RE = re.compile(r"^([^=:\s#;\[][^=:]*?)[ \t]*[=:][ \t]*(.*(?:\n[ \t]+\S.*)*)", re.M)
+
+# Parsed files keyed by (path, mtime, size).
+_PARSE_CACHE: dict[tuple, dict] = {}
+
+
+def mmap_text(f, size: int) -> str:
+    """Decode an open binary file (of `size` bytes) in one memory-mapped pass."""
+    if not size:
+        # Empty files cannot be memory-mapped.
+        return ""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[:].decode("utf-8")
+
+
+def _clean_value(value: str) -> str:
+    return "\n".join(line.strip() for line in value.splitlines())
+
+
+def parse_sections(text: str) -> dict[str, dict[str, str]]:
+    sections = tuple(_SECTION_RE.finditer(text))
+    ends = (*(s.start() for s in sections[1:]), len(text))
+    return {
+        s.group(1): {
+            k.lower(): _clean_value(v)
+            for k, v in _KV_RE.findall(text, s.end(), end)
+        }
+        for s, end in zip(sections, ends)
+    }
+
+
+def fast_parse(path: PathLike) -> dict[str, dict[str, str]]:
+    """
+    Parse a simple INI-style file (e.g. `setup.cfg`) into a plain dictionary.
+
+    Unlike `ConfigFileParser`, no interpolation or `DEFAULT` section handling is done.
+    The file is memory-mapped and its section and key-value pairs are matched with \
+        two precompiled regexes. Results are cached until the file's mtime or size changes.
+
+    ### Parameters:
+        - `path`: The path to the configuration file.
+
+    ### Returns:
+        - A dictionary mapping each section to its key-value pairs.
+
+    ### Exceptions:
+        - `ConfigException`: Raised when the configuration file is not found.
+    """
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+            if (cached := _PARSE_CACHE.get(key)) is not None:
+                return cached
+
+            text = mmap_text(f, st.st_size)
+    except FileNotFoundError:
+        raise ConfigException(f"Configuration file not found: {path!r}.")
+
+    sections = _PARSE_CACHE[key] = parse_sections(text)
+    return sections
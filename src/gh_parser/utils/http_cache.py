@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .type_hints import Any, Union
+
+
+CacheEntry = namedtuple("CacheEntry", ("etag", "last_modified", "body", "expires_at"))
+
+
+class ResponseCache:
+    """
+    A cache of GitHub API responses and their validators.
+
+    Fresh entries are returned without a request. Once an entry expires, its `ETag` and
+    `Last-Modified` values are sent as `If-None-Match` and `If-Modified-Since` so
+    unchanged endpoints answer with `304 Not Modified`.
+    Conditional requests that return `304` do not count against GitHub's primary rate limit.
+
+    Entries with validators are also persisted to an SQLite database, so later runs only
+    pay for a `304` per unchanged endpoint. Persisted entries are always revalidated.
+    The database is only used from a dedicated thread (never the event loop), and new
+    entries are written in batches with one commit each.
+
+    ### Parameters:
+        - `path`: The path of the SQLite database.
+            ~ If `None`, the cache is kept in memory only.
+            ~ The shared `RESPONSE_CACHE` is only persisted to `$GH_PARSER_CACHE`,
+            when set. Bodies are stored as-is (including private file contents).
+        - `max_entries`: The maximum number of entries kept in memory.
+            ~ The least recently used entries are evicted first.
+
+    ### Attributes:
+        - `LIST_TTL` (int): Seconds a list/metadata response is considered fresh.
+        - `BLOB_TTL` (int): Seconds a tree/blob/contents response is considered fresh.
+        - `BLOB_ENDPOINTS` (tuple): URL fragments that identify tree/blob/contents endpoints.
+        - `NO_CACHE_ENDPOINTS` (tuple): URL fragments that are always revalidated.
+
+    ### Methods:
+        - `make_key`: Builds the cache key for a request.
+        - `get`: Returns the cached entry for a key (fresh or stale).
+            ~ A coroutine, as entries may be loaded from the database.
+        - `validators`: Returns the conditional request headers for an entry.
+        - `store`: Stores a new response body with its validators.
+        - `refresh`: Extends the lifetime of an entry after a `304` response.
+        - `clear`: Removes all entries (including persisted ones).
+    """
+
+    LIST_TTL: int = 60
+    BLOB_TTL: int = 300
+    BLOB_ENDPOINTS: tuple[str, ...] = ("/git/trees/", "/git/blobs/", "/contents/")
+    NO_CACHE_ENDPOINTS: tuple[str, ...] = ("/rate_limit",)
+
+    def __init__(self, path: Union[str, None] = None, max_entries: int = 1024):
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._max_entries = max_entries
+        self._db = self._connect(path) if path else None
+        # Entries waiting to be written by the next batch.
+        self._pending: dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._io = None
+        if self._db is not None:
+            self._io = ThreadPoolExecutor(1, thread_name_prefix="gh_parser_cache")
+
+    @staticmethod
+    def _connect(path: str) -> Union[sqlite3.Connection, None]:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT)"
+            )
+            db.commit()
+        except (OSError, sqlite3.Error):
+            # Read-only or unavailable locations fall back to the in-memory cache.
+            return
+        return db
+
+    def _load(self, key: tuple) -> Union[CacheEntry, None]:
+        # Runs on the database thread.
+        try:
+            row = self._db.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?",
+                (repr(key),),
+            ).fetchone()
+        except sqlite3.Error:
+            return
+        if row is None:
+            return
+        etag, last_modified, body = row
+        # Stale on arrival, so it is only ever used after a `304` response.
+        return CacheEntry(etag, last_modified, json.loads(body), 0.0)
+
+    def _put(self, key: tuple, entry: CacheEntry):
+        entries = self._entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+    def _save(self, key: tuple, entry: CacheEntry):
+        with self._lock:
+            # Only the first pending entry schedules a write; later ones join its batch.
+            schedule = not self._pending
+            self._pending[repr(key)] = entry
+        if schedule:
+            self._io.submit(self._flush)
+
+    def _flush(self):
+        # Runs on the database thread.
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        rows = []
+        for key, entry in pending.items():
+            try:
+                body = json.dumps(entry.body)
+            except (TypeError, ValueError):
+                continue
+            rows.append((key, entry.etag, entry.last_modified, body))
+        try:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", rows
+            )
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _delete_all(self):
+        # Runs on the database thread.
+        try:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def make_key(method: str, url: str, headers: dict = None, *extra) -> tuple:
+        auth = (headers or {}).get("Authorization", "")
+        auth_hash = hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else ""
+        return (method.upper(), url, auth_hash, *extra)
+
+    @classmethod
+    def _ttl(cls, url: str) -> int:
+        if any(e in url for e in cls.NO_CACHE_ENDPOINTS):
+            return 0
+        if any(e in url for e in cls.BLOB_ENDPOINTS):
+            return cls.BLOB_TTL
+        return cls.LIST_TTL
+
+    @staticmethod
+    def is_fresh(entry: CacheEntry) -> bool:
+        return entry.expires_at > time.monotonic()
+
+    async def get(self, key: tuple) -> Union[CacheEntry, None]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self._db is not None:
+            loop = asyncio.get_running_loop()
+            if entry := await loop.run_in_executor(self._io, self._load, key):
+                self._put(key, entry)
+        return entry
+
+    @staticmethod
+    def validators(entry: Union[CacheEntry, None]) -> dict:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: tuple, headers, body: Any):
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        ttl = self._ttl(key[1])
+        if not any((etag, last_modified, ttl)):
+            return
+        entry = CacheEntry(etag, last_modified, body, time.monotonic() + ttl)
+        self._put(key, entry)
+        if self._db is not None and any((etag, last_modified)):
+            self._save(key, entry)
+
+    def refresh(self, key: tuple):
+        if entry := self._entries.get(key):
+            expires_at = time.monotonic() + self._ttl(key[1])
+            self._entries[key] = entry._replace(expires_at=expires_at)
+
+    def clear(self):
+        self._entries.clear()
+        if self._db is not None:
+            with self._lock:
+                self._pending.clear()
+            self._io.submit(self._delete_all).result()
+
+
+# Persisting responses to disk is opt-in.
+RESPONSE_CACHE = ResponseCache(os.environ.get("GH_PARSER_CACHE") or None)
@@ -1,29 +1,179 @@
 import asyncio
+import atexit
+import os
 import posixpath
 import re
-from aiohttp import ClientSession, TCPConnector
+import socket
+import sys
+import threading
+import time
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp.abc import AbstractResolver
 from aiohttp.client_exceptions import (
     ClientConnectionError,
+    ClientError,
     ClientResponseError,
     ContentTypeError,
     ServerDisconnectedError,
     InvalidURL,
 )
-from async_lru import alru_cache
 from collections import namedtuple, OrderedDict
 from configparser import ConfigParser
-from functools import cache, cached_property, partial
+from functools import cache
 from itertools import chain
 from pathlib import Path
-
+from urllib.parse import quote
+
+try:
+    # C-accelerated drop-in replacement for async_lru.
+    from faster_async_lru import alru_cache
+except ImportError:
+    from async_lru import alru_cache
+
+try:
+    # C-accelerated drop-in for `functools.cached_property` (installed with aiohttp).
+    from propcache.api import cached_property
+except ImportError:
+    from functools import cached_property
+
+try:
+    # Faster drop-in event loop (uvloop does not support Windows).
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
+
+try:
+    # Non-blocking c-ares DNS resolution.
+    # aiodns requires a selector event loop, so it is skipped on Windows.
+    if sys.platform == "win32":
+        raise ImportError
+    # Only imported to check it is installed (`AsyncResolver` requires it).
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver as _BaseResolver
+except ImportError:
+    from aiohttp.resolver import DefaultResolver as _BaseResolver
+
+try:
+    from orjson import dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(obj) -> str:
+        # aiohttp expects a `str` serializer, `orjson` returns bytes.
+        return _orjson_dumps(obj).decode()
+
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
+try:
+    # Incremental parsing of (large) recursive repository trees.
+    import ijson
+except ImportError:
+    ijson = None
 
 from .endpoints import OTHER_ENDPOINTS
+from .fast_cfg import mmap_text
 from .exceptions import APIException, ConfigException, GHException
-from .type_hints import PathLike
-from .utils import _Repr, decode_string, executor, get_parameters, str_instance
+from .http_cache import RESPONSE_CACHE
+from .rate_limit import get_rate_limiter
+from .type_hints import Callable, Iterable, PathLike
+from .utils import _Repr, decode_string, executor, fast_namedtuple, hybridmethod
 from .wrappers import time_wrap, verbose_wrap
 
 
+# region Shared Session
+_LOOP_LOCK = threading.Lock()
+_LOOP: asyncio.AbstractEventLoop = None
+_SESSION: ClientSession = None
+# Resolved addresses shared across sessions, keyed by (host, port, family).
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    # A single background event loop shared by every parser (and thread),
+    # so the `ClientSession` bound to it can be reused across requests.
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever, name="gh_parser-loop", daemon=True
+            ).start()
+    return _LOOP
+
+
+class _CachingResolver(AbstractResolver):
+    # Caches the addresses of the wrapped resolver for `ttl` seconds.
+    # Unlike the connector's own DNS cache, this outlives a closed session.
+    def __init__(self, resolver: AbstractResolver, ttl: int):
+        self._resolver = resolver
+        self._ttl = ttl
+
+    async def resolve(self, host: str, port: int = 0, family=socket.AF_INET):
+        key = (host, port, family)
+        cached = _DNS_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        addrs = await self._resolver.resolve(host, port, family)
+        _DNS_CACHE[key] = (time.monotonic() + self._ttl, addrs)
+        return addrs
+
+    async def close(self):
+        await self._resolver.close()
+
+
+async def _get_session() -> ClientSession:
+    # Only ever awaited on the shared loop, so no lock is required.
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        # Connections are kept alive (no `force_close`), and aiohttp already
+        # sets `TCP_NODELAY` on every connection it opens.
+        _SESSION = ClientSession(
+            connector=TCPConnector(
+                resolver=_CachingResolver(_BaseResolver(), APIParser.TTL_DNS),
+                limit=APIParser.POOL_LIMIT,
+                limit_per_host=APIParser.POOL_LIMIT_PER_HOST,
+                keepalive_timeout=APIParser.KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+                ssl=False,
+                ttl_dns_cache=APIParser.TTL_DNS,
+            ),
+            # Connect and per-read limits only, so large (still streaming)
+            # trees and raw files are not cut off by a total deadline.
+            timeout=ClientTimeout(sock_connect=5, sock_read=30),
+            raise_for_status=True,
+            json_serialize=json_dumps,
+        )
+    return _SESSION
+
+
+def run_coroutine(coro):
+    """Run `coro` on the shared event loop and block until it completes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _aclose_session():
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
+@atexit.register
+def _close_session():
+    if _LOOP is not None and _SESSION is not None:
+        asyncio.run_coroutine_threadsafe(_aclose_session(), _LOOP).result(timeout=5)
+
+
+# region Repository URLs
+# The URLs of a repository. Per-file URLs are (prefix, suffix) pairs
+# around the (quoted) path or sha.
+_RepoCtx = namedtuple(
+    "_RepoCtx", ("repo", "headers", "tree_url", "source_url", "raw_url", "blob_url")
+)
+
+# Main API endpoints whose URL stem is a plain lowercase word (e.g. `/emojis`).
+_LOWER_ONLY_RE = re.compile(r"^[a-z]+$")
+
+
 # region ConfigFileParser
 class ConfigFileParser(ConfigParser):
     """
@@ -70,7 +220,9 @@ class ConfigFileParser(ConfigParser):
     
     """
 
-    __slots__: dict = ("_config", "_cf", "_df", "_enhance")
+    # `ConfigParser` instances already carry a `__dict__` (also needed by the
+    # cached properties), so these slots only document the instance attributes.
+    __slots__: tuple[str, ...] = ("_config", "_cf", "_df", "_enhance")
 
     def __init__(self, config_file: PathLike, *args, **kwargs):
         self._config = None
@@ -89,7 +241,10 @@ class ConfigFileParser(ConfigParser):
         return cf
 
     def _read_cf(self):
-        self.read(self._cf)
+        # One mapped read and decode, rather than `read`'s line-by-line file iteration.
+        with open(self._cf, "rb") as f:
+            text = mmap_text(f, os.fstat(f.fileno()).st_size)
+        self.read_string(text, source=str(self._cf))
 
     @classmethod
     def _format_dict(cls, cf_dict: dict, *, enhance: bool = False):
@@ -98,11 +253,10 @@ class ConfigFileParser(ConfigParser):
                 cf = {k: {**v} for k, v in cf_dict.items()}
             case True:
                 cf_dict = {k.replace(".", "_"): v for k, v in cf_dict.items()}
-                _pnt = partial(namedtuple, rename=True)
                 main_name = cls.__name__.removesuffix("Parser")
-                OuterNT = _pnt(main_name, field_names=(*cf_dict,))
+                OuterNT = fast_namedtuple(main_name, (*cf_dict,))
                 nts = {
-                    k: _pnt(k, field_names=(*v,))(*v.values())
+                    k: fast_namedtuple(k, (*v,))(*v.values())
                     for k, v in cf_dict.items()
                 }
 
@@ -135,6 +289,11 @@ class APIParser:
     """
     A custom `APIParser` class that fetches data from the specified URL or API.
 
+    All requests share one pooled `ClientSession` and event loop. Concurrent requests
+    for the same endpoint are merged, and responses are cached briefly and revalidated
+    with `ETag` headers. Requests are throttled by a shared `RateLimiter`, and rate
+    limited or failed (5xx) requests are retried with exponential backoff.
+
     ### Parameters:
         - `url`: The URL to fetch data from.
         - `endpoint`: The endpoint to fetch data from.
@@ -143,11 +302,20 @@ class APIParser:
 
     ### Methods:
         - `api_request`: Fetches data from the specified URL.
+        - `post_request`: Posts a JSON payload to the specified URL.
+        - `close_session`: Closes the shared `ClientSession` (also done at exit).
+        - `clear_cache`: Drops all cached responses, forcing full requests again.
         - `joinurl`: Joins the specified URL parts.
 
     ### Properties (Cached):
         - `TTL_DNS` (int): The time-to-live for the DNS cache.
-            ~ This is set to 300 seconds by default.
+            ~ This is set to 600 seconds by default.
+            ~ Resolved hosts are also kept for this long across sessions.
+        - `POOL_LIMIT` / `POOL_LIMIT_PER_HOST` (int): The connection pool limits (100 / 20).
+        - `KEEPALIVE_TIMEOUT` (int): Seconds an idle connection is kept open (75).
+        - `MAX_IN_FLIGHT` (int): The maximum concurrent requests of a batched fetch (64).
+        - `MAX_RECONNECTS` (int): The attempts made for a request whose connection drops (5).
+            ~ Attempts are spaced by `RECONNECT_DELAY` (0.2s), doubling each time.
         - `get_contents` (dict): The fetched contents of the API.
 
     ### Exceptions:
@@ -165,7 +333,23 @@ class APIParser:
 
     """
 
-    TTL_DNS: int = 300
+    TTL_DNS: int = 600
+    POOL_LIMIT: int = 100
+    POOL_LIMIT_PER_HOST: int = 20
+    KEEPALIVE_TIMEOUT: int = 75
+    MAX_IN_FLIGHT: int = 64
+    MAX_RECONNECTS: int = 5
+    RECONNECT_DELAY: float = 0.2
+    # The request parameters of `api_request` (resolved once, not per request).
+    _RQ_KEYS: tuple[str, ...] = ("url", "headers", "json_format")
+
+    __slots__: tuple[str, ...] = (
+        "_url",
+        "_endpoint",
+        "_headers",
+        "_jf",
+        "_parsed_contents",
+    )
 
     def __init__(
         self,
@@ -186,7 +370,7 @@ class APIParser:
     def _validate_args(self):
         url, headers, endp, _jf = self._url, self._headers, self._endpoint, self._jf
 
-        if not all(map(str_instance, (url, endp))):
+        if not (type(url) is str and type(endp) is str):
             raise APIException("The URL and endpoint must be strings.")
 
         if not isinstance(headers, dict):
@@ -196,52 +380,150 @@ class APIParser:
 
     @classmethod
     async def api_request(cls, **kwargs):
-        cls_params = get_parameters(cls, keys_only=False)
-        url, headers, jf = tuple(
-            kwargs.get(k, v) for k, v in cls_params.items() if k != "endpoint"
-        )
+        url, headers, jf = map(kwargs.get, cls._RQ_KEYS)
+        return await cls._request(url, tuple((headers or {}).items()), bool(jf))
 
-        try:
-            async with ClientSession(
-                connector=TCPConnector(
-                    enable_cleanup_closed=True,
-                    ssl=False,
-                    force_close=True,
-                    ttl_dns_cache=cls.TTL_DNS,
-                ),
-                raise_for_status=True,
-            ) as session:
-                async with session.get(url, headers=headers) as response:
-                    return await cls._format_response(response, json_format=jf)
-        except (ClientResponseError, ContentTypeError) as ccre:
-            raise ccre
-        except (ClientConnectionError, ServerDisconnectedError):
-            return await cls.api_request(url, headers=headers, json_format=jf)
-        except InvalidURL:
-            raise APIException(f"Invalid URL: {url = }")
+    @classmethod
+    @alru_cache(maxsize=1024, ttl=0)
+    async def _request(cls, url: str, header_items: tuple, jf: bool):
+        # Keyed on the request (not the ephemeral response object), so concurrent
+        # fetches of the same endpoint share one in-flight request. Entries are
+        # dropped once it completes; freshness is left to `RESPONSE_CACHE`.
+        headers = dict(header_items)
+        cache_key = RESPONSE_CACHE.make_key("GET", url, headers, jf)
+        cached = await RESPONSE_CACHE.get(cache_key)
+        if cached is not None and RESPONSE_CACHE.is_fresh(cached):
+            return cached.body
+
+        req_headers = {**headers, **RESPONSE_CACHE.validators(cached)}
+        for attempt in range(1, cls.MAX_RECONNECTS + 1):
+            try:
+                session = await _get_session()
+                async with session.get(url, headers=req_headers) as response:
+                    get_rate_limiter(url).update(response.headers)
+                    if response.status == 304 and cached is not None:
+                        RESPONSE_CACHE.refresh(cache_key)
+                        return cached.body
+                    contents = await cls._format_response(response, json_format=jf)
+                    RESPONSE_CACHE.store(cache_key, response.headers, contents)
+                    return contents
+            except (ClientResponseError, ContentTypeError) as ccre:
+                raise ccre
+            except (ClientConnectionError, ServerDisconnectedError) as cce:
+                # Dropped connections are retried (a bounded number of times),
+                # backing off exponentially so resets are not retried in a hot loop.
+                connection_error = cce
+                if attempt < cls.MAX_RECONNECTS:
+                    await asyncio.sleep(cls.RECONNECT_DELAY * 2 ** (attempt - 1))
+            except InvalidURL:
+                raise APIException(f"Invalid URL: {url = }")
+        raise APIException(
+            f"Unable to connect after {attempt} attempts: {url = }"
+        ) from connection_error
+
+    @staticmethod
+    def close_session():
+        """Close the shared `ClientSession`; it is recreated on the next request."""
+        run_coroutine(_aclose_session())
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop every cached response (in memory and on disk) and its `ETag`."""
+        cls._request.cache_clear()
+        RESPONSE_CACHE.clear()
+
+    @classmethod
+    async def post_request(cls, *, url: str, payload: dict, headers: dict = None):
+        session = await _get_session()
+        async with session.post(url, json=payload, headers=headers) as response:
+            get_rate_limiter(url).update(response.headers)
+            return await response.json(loads=json_loads)
 
     @staticmethod
-    @alru_cache
     async def _format_response(response: str, json_format: bool = True):
-        return await getattr(response, ["text", "json"][bool(json_format)])()
+        if not json_format:
+            return await response.text()
+        if response.status == 204:
+            # e.g. the `stats/*` endpoints of empty repositories.
+            return
+        if ijson is not None and "/git/trees/" in response.url.path:
+            # Tree entries are parsed as the body streams in, rather than
+            # buffering (and then parsing) the whole multi-MB payload at once.
+            tree = ijson.items(response.content, "tree.item", use_float=True)
+            return {"tree": [entry async for entry in tree]}
+        body = await response.read()
+        if not body:
+            return
+        try:
+            return json_loads(body)
+        except ValueError:
+            # Non-JSON bodies (`orjson` and `json` decode errors subclass it).
+            return
 
     @staticmethod
     def joinurl(*args, **kwargs):
         return posixpath.join(*args, **kwargs)
 
-    def _get_contents(self):
+    @classmethod
+    async def _fetch(cls, url: str, headers: dict = None, json_format: bool = True):
         try:
-            url_contents = asyncio.run(
-                self.api_request(
-                    url=self._url, headers=self._headers, json_format=self._jf
-                )
+            return await cls._with_retries(
+                url,
+                lambda: cls.api_request(
+                    url=url, headers=headers, json_format=json_format
+                ),
             )
         except ClientResponseError:
             # For missing or invalid endpoints.
-            url_contents = None
-        return url_contents
+            return None
 
-    @cached_property
+    @staticmethod
+    async def _with_retries(url: str, send: Callable):
+        # Awaits `send()` once the rate limiter allows it, retrying rate limited or
+        # failed (5xx) responses. Other errors are raised as they are.
+        limiter = get_rate_limiter(url)
+        attempt = 0
+        while True:
+            while (delay := limiter.wait_time()) > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await send()
+            except ClientResponseError as cre:
+                limiter.update(cre.headers)
+                if not limiter.should_retry(cre.status, cre.headers):
+                    raise
+                if attempt >= limiter.MAX_RETRIES:
+                    raise APIException(
+                        f"Request failed after {attempt} retries "
+                        f"({cre.status}, {cre.message}): {url = }"
+                    )
+                await asyncio.sleep(limiter.retry_delay(cre.headers, attempt))
+                attempt += 1
+
+    @classmethod
+    async def _fetch_many(
+        cls,
+        urls: Iterable[str],
+        headers: dict = None,
+        json_format: bool = True,
+        limit: int = None,
+    ) -> list:
+        # Fetches all URLs concurrently on the shared session (in order).
+        semaphore = asyncio.Semaphore(cls.MAX_IN_FLIGHT if limit is None else limit)
+
+        async def _fetch_one(url):
+            async with semaphore:
+                return await cls._fetch(url, headers=headers, json_format=json_format)
+
+        return await asyncio.gather(*map(_fetch_one, urls))
+
+    def _get_contents(self):
+        with get_rate_limiter(self._url):
+            return run_coroutine(
+                self._fetch(self._url, headers=self._headers, json_format=self._jf)
+            )
+
+    @property
     def get_contents(self):
         if self._parsed_contents is None:
             self._parsed_contents = self._get_contents()
@@ -263,6 +545,12 @@ class GitHubParser(APIParser):
         - `token`: The GitHub API token.
         - `include_empty_files`: Whether to include empty files in the repository.
         - `verbose`: Whether to enable verbose output.
+        - `use_graphql`: Whether to fetch `full_stats` with a single GraphQL query.
+            ~ Requires a token. Otherwise one REST request is made per endpoint.
+        - `concurrency`: The maximum number of concurrent requests when fanning out.
+        - `cache_size`: The maximum number of `get_path_contents` results kept in memory.
+            ~ Each instance has its own cache, which evicts the least recently used.
+            ~ `0` disables it; failed lookups are never cached.
 
     ### Properties:
         - `branch` (str): The branch of the repository.
@@ -274,12 +562,14 @@ class GitHubParser(APIParser):
 
     ### Methods:
         - `get_path_contents`: Fetches the contents of the specified path.
-        - `main_parser`: The main parser for the GitHub API.
         - `rate_limit`: Gets the current GitHub API rate limit.
+            ~ Called on an instance, the limit of its token is returned.
             ~ `key` (str): The key to retrieve the rate limit data.
                 ~ If `key` is not provided, the full rate limit data is returned.
         - `get_path_contents`: Gets the contents of the specified path.
             ~ `path` (str): The path to the file.
+        - `aget_path_contents`: The coroutine behind `get_path_contents`.
+            ~ `repo` (str): The repository of the path (defaults to `repo`).
 
     ### Properties (Including Cached):
         - `GITHUB_API` (str): The GitHub API URL (https://api.github.com).
@@ -287,7 +577,13 @@ class GitHubParser(APIParser):
             - `REPO_URL` (str): The repository URL (/users/{owner}/repos).
             - `SOURCE_URL` (str): The source URL for the repository contents (/contents/{path}?ref={branch}).
             - `TREE_URL` (str): The tree URL for the repository (/git/trees/{branch}?recursive=1).
+            - `BLOB_URL` (str): The blob URL for the full branch contents (/git/blobs/{sha}).
             - `OTHER_ENDPOINTS` (tuple): Other endpoints to fetch data from the GitHub API.
+            - `GRAPHQL_API` (str): The GraphQL API URL (/graphql).
+        - `RAW_URL` (str): The raw file URL, used for files of `MAX_CONTENTS_SIZE` (1 MiB) or more.
+        - `DECODE_OFFLOAD_SIZE` (int): Files of this size (64 KiB) or more are decoded \
+            in a worker thread instead of on the event loop.
+        - `RATE_LIMIT_TTL` (int): Seconds a `rate_limit` response is reused (10).
         - `MAIN_HEADERS` (dict): The main headers for the GitHub API.
         - `branch`: The branch of the repository.
         - `full_stats`: The full statistics of the repository.
@@ -322,7 +618,34 @@ class GitHubParser(APIParser):
     REPO_URL: str = GITHUB_API + "/users/{owner}/repos"
     SOURCE_URL: str = MAIN_API + "/contents/{path}?ref={branch}"
     TREE_URL: str = MAIN_API + "/git/trees/{branch}?recursive=1"
+    BLOB_URL: str = MAIN_API + "/git/blobs/{sha}"
     OTHER_ENDPOINTS: tuple[str, ...] = OTHER_ENDPOINTS
+    # e.g. "actions/workflows" -> "actions-workflows"
+    _ENDPOINT_LABELS: dict[str, str] = {
+        e: "-".join(e.split("/")[-2:]) for e in OTHER_ENDPOINTS
+    }
+    GRAPHQL_API: str = GITHUB_API + "/graphql"
+    RAW_URL: str = "https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+    MAX_CONTENTS_SIZE: int = 1024**2
+    DECODE_OFFLOAD_SIZE: int = 64 * 1024
+    RATE_LIMIT_TTL: int = 10
+    # The last `/rate_limit` response (and when it was fetched) per credential.
+    _RATE_LIMIT_CACHE: dict[str, tuple[float, dict]] = {}
+    REPO_STATS_QUERY: str = """
+    query($owner: String!, $name: String!) {
+        repository(owner: $owner, name: $name) {
+            description
+            stargazerCount
+            forkCount
+            diskUsage
+            watchers { totalCount }
+            defaultBranchRef { name }
+            languages(first: 10) { nodes { name } }
+            issues(states: OPEN) { totalCount }
+            pullRequests(states: OPEN) { totalCount }
+        }
+    }
+    """
     MAIN_HEADERS: dict = {
         "Accept": "application/vnd.github.v3+json",
         "Authorization": "",
@@ -333,9 +656,20 @@ class GitHubParser(APIParser):
         "_repo",
         "_branch",
         "_token",
-        "_include_empty_files",
+        "_empty_files",
         "_verbose",
-        "_headers",
+        "_use_graphql",
+        "_concurrency",
+        "_cache_size",
+        "_path_cache",
+        "_path_cache_lock",
+        "_repos",
+        "_repopaths",
+        "_repo_stats",
+        "_full_branch",
+        "_main_page",
+        "_repo_ctxs",
+        "OTHER_MAIN_ENDPOINTS",
     )
 
     def __init__(
@@ -348,6 +682,9 @@ class GitHubParser(APIParser):
         token: str = "",
         include_empty_files: bool = False,
         verbose=False,
+        use_graphql: bool = False,
+        concurrency: int = 64,
+        cache_size: int = 2048,
     ):
         if config_file:
             main_keys = ("owner", "token", "repo", "branch")
@@ -376,6 +713,11 @@ class GitHubParser(APIParser):
         # Boolean Arguments
         self._empty_files = include_empty_files
         self._verbose = verbose
+        self._use_graphql = use_graphql
+
+        # Integer Arguments
+        self._concurrency = int(concurrency)
+        self._cache_size = int(cache_size)
 
         # Validate Arguments
         self._validate_args()
@@ -387,21 +729,26 @@ class GitHubParser(APIParser):
         self._repopaths = None
         self._repo_stats = None
         self._full_branch = None
+        self._main_page = None
 
-    @classmethod
-    def __call__(cls, **kwargs):
-        kwargs.update({"headers": cls.MAIN_HEADERS, "json_format": True})
-        parent_parser = cls.__bases__[0]
-        return parent_parser(**kwargs)
+        # Per-repository fetch contexts.
+        self._repo_ctxs: dict[str, _RepoCtx] = {}
 
-    @staticmethod
-    def _clean_token(token: str) -> str:
-        return "token " + token.removeprefix("token ")
+        # Decoded path contents, in least recently used order.
+        self._path_cache: OrderedDict = OrderedDict()
+        self._path_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get(cls, url: str, headers: dict = None):
+        # Fetches (JSON) on the shared session, without an `APIParser` per request.
+        with get_rate_limiter(url):
+            return run_coroutine(cls._fetch(url, headers=headers or cls.MAIN_HEADERS))
 
     @verbose_wrap("Validating Arguments.")
     def _validate_args(self):
-        if not any(
-            (str_instance, (self._owner, self._repo, self._branch, self._token))
+        if not all(
+            type(x) is str
+            for x in (self._owner, self._repo, self._branch, self._token)
         ):
             raise GHException(
                 f"All {self.__class__.__name__!r} arguments must be type of {str}."
@@ -410,42 +757,67 @@ class GitHubParser(APIParser):
         if not self._owner:
             raise GHException("The owner of the repository must be provided.")
 
-        self._token = self._clean_token(self._token)
-        self._headers = self.MAIN_HEADERS
+        if self._concurrency < 1:
+            raise GHException("The concurrency must be at least 1.")
+
+        # A copy, so one instance's token never leaks into `MAIN_HEADERS`.
+        self._headers = dict(self.MAIN_HEADERS)
 
-        if self._token:
-            self._headers.update({"Authorization": self._token})
+        if token := self._token.removeprefix("token ").strip():
+            self._token = self._headers["Authorization"] = f"token {token}"
+        else:
+            self._token = ""
 
     @staticmethod
     def _get_stem(p):
-        return Path(p).stem
+        # Same as `Path(p).stem`, without constructing a path.
+        name = p.rstrip("/").rpartition("/")[2]
+        stem, dot, suffix = name.rpartition(".")
+        return stem if all((dot, stem, suffix)) else name
 
     @classmethod
     def _get_main_endpoints(cls) -> dict:
-        main_api = cls.main_parser(url=cls.GITHUB_API)
-        pattern = re.compile(r"^[a-z]+$")
+        main_api = cls._get(cls.GITHUB_API)
+        get_stem = cls._get_stem
         main_endpoints = {
-            k: v for k, v in main_api.items() if pattern.match(cls._get_stem(v))
+            k: v for k, v in main_api.items() if _LOWER_ONLY_RE.match(get_stem(v))
         }
         return main_endpoints
 
     def _parse_main_endpoints(self):
-        om_endpoints = self.OTHER_MAIN_ENDPOINTS
-        zipped_contents = zip(
-            om_endpoints,
-            executor(lambda url: self.main_parser(url=url), om_endpoints.values()),
-        )
-        return _Repr(
-            (k, ((_k, _v) for _k, _v in v if not _k.endswith("_url")))
-            for k, v in zipped_contents
-            if v
-        )
+        # Every endpoint is fetched in a single batch, once per instance.
+        if self._main_page is None:
+            om_endpoints = self.OTHER_MAIN_ENDPOINTS
+            responses = run_coroutine(
+                self._fetch_many(
+                    om_endpoints.values(),
+                    headers=self._headers,
+                    limit=self._concurrency,
+                )
+            )
+            self._main_page = _Repr(
+                {
+                    k: (
+                        tuple(
+                            (_k, _v) for _k, _v in v.items() if not _k.endswith("_url")
+                        )
+                        if isinstance(v, dict)
+                        else v
+                    )
+                    for k, v in zip(om_endpoints, responses)
+                    if v
+                }
+            )
+        return self._main_page
 
     def _get_repo_stats(self):
-        api_parser = partial(self.main_parser, headers=self._headers)
+        # The main and every other endpoint are fetched in a single batch.
         url = self.MAIN_API.format(owner=self._owner, repo=self._repo)
-        main_stats = api_parser(url=url)
-        OTHER_ENDPOINTS = self.OTHER_ENDPOINTS
+        endpoint_labels = self._ENDPOINT_LABELS
+        urls = (url, *(url + "/" + e for e in endpoint_labels))
+        main_stats, *other_responses = run_coroutine(
+            self._fetch_many(urls, headers=self._headers, limit=self._concurrency)
+        )
 
         if not main_stats:
             raise GHException(
@@ -453,148 +825,277 @@ class GitHubParser(APIParser):
                 f"{self._owner + '/' + self._repo!r}."
             )
 
-        stats = (
+        full_stats = _Repr(
             (k, v)
             for k, v in main_stats.items()
             if k.endswith("count") or k == "description"
         )
+        full_stats.update(zip(endpoint_labels.values(), other_responses))
+        return full_stats
+
+    def _graphql(self, query: str, variables: dict = None) -> dict:
+        if not self._token:
+            raise GHException("A token is required to use the GitHub GraphQL API.")
+
+        url, payload = self.GRAPHQL_API, {"query": query, "variables": variables or {}}
+        try:
+            response = run_coroutine(
+                self._with_retries(
+                    url,
+                    lambda: self.post_request(
+                        url=url, payload=payload, headers=self._headers
+                    ),
+                )
+            )
+        except ClientError as ce:
+            raise GHException(f"GraphQL request failed: {ce}") from ce
+        if errors := response.get("errors"):
+            raise GHException(
+                f"GraphQL query failed: {', '.join(e.get('message', '') for e in errors)}"
+            )
+        return response["data"]
+
+    @verbose_wrap("Fetching repository statistics from the GraphQL API.")
+    def _get_repo_stats_graphql(self):
+        data = self._graphql(
+            self.REPO_STATS_QUERY, {"owner": self._owner, "name": self._repo}
+        )
+        repo = data.get("repository")
 
-        def _format_endpoint(endp):
-            e = next((i for i in OTHER_ENDPOINTS if i.endswith(endp)), "")
-            return "-".join(Path(endp).parts[-2:]) if e else endp
+        if not repo:
+            raise GHException(
+                f"Unable to fetch repository statistics for "
+                f"{self._owner + '/' + self._repo!r}."
+            )
 
-        other_urls = (self.joinurl(url, i) for i in OTHER_ENDPOINTS)
-        other_exec = executor(lambda u: api_parser(url=u), other_urls)
-        other_stats = zip(map(_format_endpoint, OTHER_ENDPOINTS), other_exec)
-        full_stats = chain.from_iterable((stats, other_stats))
-        return _Repr(full_stats)
+        default_branch = repo["defaultBranchRef"]
+        open_issues, open_pulls = (
+            repo[k]["totalCount"] for k in ("issues", "pullRequests")
+        )
+        # Same semantics as the REST fields: `watchers_count` mirrors the stargazers
+        # (the watchers are `subscribers_count`), and open issues include open PRs.
+        return _Repr(
+            description=repo["description"],
+            stargazers_count=repo["stargazerCount"],
+            forks_count=repo["forkCount"],
+            watchers_count=repo["stargazerCount"],
+            subscribers_count=repo["watchers"]["totalCount"],
+            open_issues_count=open_issues + open_pulls,
+            open_pulls_count=open_pulls,
+            disk_usage=repo["diskUsage"],
+            default_branch=default_branch and default_branch["name"],
+            languages=tuple(n["name"] for n in repo["languages"]["nodes"]),
+        )
 
     def _main_gh_api(self) -> dict:
         url = self.REPO_URL.format(owner=self._owner)
-        response = self.main_parser(url=url, headers=self._headers)
+        response = self._get(url, headers=self._headers)
         return response
 
     @verbose_wrap("Fetching main repository tree.")
     def _main_repotree(self) -> dict:
-        url = self.TREE_URL.format(
-            owner=self._owner, repo=self._repo, path="", branch=self._branch
-        )
-        response = self.main_parser(url=url, headers=self._headers)
+        url = self._repo_ctx(self._repo).tree_url
+        response = self._get(url, headers=self._headers)
         return response
 
     @verbose_wrap("Fetching repository contents from main GitHub API.")
     def _get_repositories(self):
-        gh_contents = self._main_gh_api()
+        return self._repo_names(self._main_gh_api())
 
+    @staticmethod
+    def _repo_names(gh_contents):
         repos = None
 
         if gh_contents:
             repos = tuple(k["name"] for k in gh_contents)
         return repos
 
-    @verbose_wrap("Fetching repository relative paths.")
-    def _get_repo_paths(self):
-        main_tree = self._main_repotree()
-
-        repo_paths = None
-
-        def not_hidden(p):
-            valid_p = Path(p).parts[-1]
-            if valid_p.startswith(".") and not self._include_empty_files:
-                return
-            return valid_p
+    def _tree_entries(self, main_tree):
+        tree_entries = None
 
         if main_tree:
             tree = main_tree.get("tree")
             if tree is None:
                 return
-            repo_paths = tuple(k["path"] for k in tree if not_hidden(k["path"]))
-        return repo_paths
+            if self._empty_files:
+                return tuple(tree)
+            tree_entries = tuple(
+                k for k in tree if not k["path"].rsplit("/", 1)[-1].startswith(".")
+            )
+        return tree_entries
 
-    @classmethod
-    def _new_cls(cls, *args, **kwargs):
-        return cls(*args, **kwargs)
+    def _tree_paths(self, main_tree):
+        tree_entries = self._tree_entries(main_tree)
+        if tree_entries is not None:
+            return tuple(k["path"] for k in tree_entries)
 
-    @classmethod
-    def _thread_processor(cls, repo=None, **kwargs):
-        if repo:
-            new_cls = cls._new_cls(repo=repo, **kwargs)
-            repo_paths = new_cls.all_repopaths
-            return repo, repo_paths, new_cls
+    @verbose_wrap("Fetching repository relative paths.")
+    def _get_repo_paths(self):
+        return self._tree_paths(self._main_repotree())
+
+    def _repo_ctx(self, repo: str) -> _RepoCtx:
+        # Per-repository state is shared by every fetch of that repository,
+        # rather than constructing (and re-validating) a parser per repository.
+        if (ctx := self._repo_ctxs.get(repo)) is None:
+            fmt = dict(
+                owner=self._owner,
+                repo=repo,
+                branch=self._branch,
+                path="\0",
+                sha="\0",
+            )
 
-    @verbose_wrap("Threading all repositories.")
-    def _thread_paths(self):
-        repos = self._get_repositories()
-        path_contents = OrderedDict()
-        main_kwargs = {
-            k.strip("_"): v
-            for k, v in vars(self).items()
-            if k in ("_owner", "_branch", "_token")
-        }
+            def _split(template: str) -> tuple[str, str]:
+                prefix, _, suffix = template.format(**fmt).partition("\0")
+                return prefix, suffix
+
+            ctx = self._repo_ctxs[repo] = _RepoCtx(
+                repo,
+                self._headers,
+                self.TREE_URL.format(**fmt),
+                _split(self.SOURCE_URL),
+                _split(self.RAW_URL),
+                _split(self.BLOB_URL),
+            )
+        return ctx
+
+    async def _afetch_tree(self, ctx: _RepoCtx):
+        response = await self._fetch(ctx.tree_url, headers=ctx.headers)
+        return self._tree_entries(response) or ()
+
+    async def aget_path_contents(self, path, repo=None):
+        return await self._afetch_path(self._repo_ctx(repo or self._repo), path)
 
-        main_executor = executor(
-            lambda repo: self._thread_processor(repo=repo, **main_kwargs), repos
+    async def _afetch_path(self, ctx: _RepoCtx, path):
+        prefix, suffix = ctx.source_url
+        url = prefix + quote(path) + suffix
+        file_response = self._file_response(
+            await self._fetch(url, headers=ctx.headers)
         )
 
-        for repo, repopaths, new_cls in main_executor:
-            path_contents[repo] = OrderedDict()
-            repo_paths = new_cls._get_repo_paths()
-            func2 = executor(lambda x: new_cls.get_path_contents(x), repopaths)
-            for rp, rp_contents in zip(repo_paths, func2):
-                if rp_contents is None and not self._empty_files:
-                    # Include empty or non-decodable files.
-                    continue
-                path_contents[repo][rp] = rp_contents
+        size = file_response.get("size", 0) if file_response else 0
+        if size >= self.MAX_CONTENTS_SIZE:
+            # The contents API omits files of 1 MiB or more.
+            prefix, suffix = ctx.raw_url
+            url = prefix + quote(path) + suffix
+            try:
+                return await self._fetch(url, headers=ctx.headers, json_format=False)
+            except UnicodeDecodeError:
+                # Non-text (binary) files.
+                return
+        return await self._adecode_file(file_response)
+
+    async def _afetch_blob(self, ctx: _RepoCtx, tree_entry: dict):
+        # Blobs are looked up by the sha of their tree entry (no path lookup),
+        # and unlike the contents API they include files of 1 MiB or more.
+        if tree_entry.get("type") != "blob":
+            return
+        prefix, suffix = ctx.blob_url
+        url = prefix + tree_entry["sha"] + suffix
+        return await self._adecode_file(await self._fetch(url, headers=ctx.headers))
+
+    async def _adecode_file(self, file_response):
+        size = file_response.get("size", 0) if file_response else 0
+        if size >= self.DECODE_OFFLOAD_SIZE:
+            # Keep the event loop free for in-flight requests while larger files decode.
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor(executor_only=True), self._decode_file, file_response
+            )
+        return self._decode_file(file_response)
 
-        return _Repr(path_contents)
+    async def _afetch_repo(self, ctx: _RepoCtx, semaphore: asyncio.Semaphore):
+        async def _bounded(coro):
+            async with semaphore:
+                return await coro
 
-    @classmethod
-    def main_parser(cls, **kwargs):
-        get_contents = kwargs.pop("get_contents", True)
-        response = cls.__call__(**kwargs)
-        return [response, response.get_contents][get_contents]
+        tree_entries = await _bounded(self._afetch_tree(ctx))
+        contents = await asyncio.gather(
+            *(_bounded(self._afetch_blob(ctx, k)) for k in tree_entries)
+        )
+        return OrderedDict(
+            (k["path"], rp_contents)
+            for k, rp_contents in zip(tree_entries, contents)
+            # Include empty or non-decodable files.
+            if rp_contents is not None or self._empty_files
+        )
 
-    @cache
-    def get_path_contents(self, path):
-        url = self.SOURCE_URL.format(
-            owner=self._owner, repo=self._repo, path=path, branch=self._branch
+    async def _crawl_all(self):
+        # The whole crawl (repositories, trees and files) runs in one coroutine.
+        if self._repos is None:
+            url = self.REPO_URL.format(owner=self._owner)
+            gh_contents = await self._fetch(url, headers=self._headers)
+            self._repos = self._repo_names(gh_contents)
+        repos = self._repos or ()
+
+        # Each repository fetches its files as soon as its own tree arrives.
+        semaphore = asyncio.Semaphore(self._concurrency)
+        all_contents = await asyncio.gather(
+            *(self._afetch_repo(self._repo_ctx(repo), semaphore) for repo in repos)
         )
-        response = self.main_parser(url=url, headers=self._headers)
-        path_contents = None
-
-        if response:
-
-            def isfile(rcontents):
-                try:
-                    is_file = rcontents.get("type", False)
-                except AttributeError:
-                    return isfile(rcontents[0])
-
-                if any((not is_file, is_file != "file")):
-                    return
-                return rcontents
-
-            file_response = isfile(response)
-            if file_response:
-                encoded_contents = file_response.get("content")
-                if encoded_contents:
-                    try:
-                        path_contents = decode_string(encoded_contents)
-                    except UnicodeDecodeError:
-                        pass
-                return path_contents
+        return OrderedDict(zip(repos, all_contents))
+
+    @verbose_wrap("Fetching all repository trees and contents.")
+    def _thread_paths(self):
+        return _Repr(run_coroutine(self._crawl_all()))
+
+    def get_path_contents(self, path):
+        if self._cache_size <= 0:
+            return run_coroutine(self.aget_path_contents(path))
+
+        path_cache = self._path_cache
+        with self._path_cache_lock:
+            if path in path_cache:
+                path_cache.move_to_end(path)
+                return path_cache[path]
+
+        path_contents = run_coroutine(self.aget_path_contents(path))
+        # Failed lookups are retried rather than cached.
+        if path_contents is not None:
+            with self._path_cache_lock:
+                path_cache[path] = path_contents
+                while len(path_cache) > self._cache_size:
+                    path_cache.popitem(last=False)
+        return path_contents
+
+    @staticmethod
+    def _file_response(response):
+        if not response:
+            return
+
+        # Directory listings are lists of entries; only the first is checked.
+        while isinstance(response, list):
+            response = response[0]
+        if response.get("type") == "file":
+            return response
+
+    @staticmethod
+    def _decode_file(file_response):
+        encoded_contents = file_response and file_response.get("content")
+        if encoded_contents:
+            try:
+                return decode_string(encoded_contents).decode("utf-8")
+            except UnicodeDecodeError:
+                pass
 
     @cache
     def get_main_page(self, key: str = None):
         main_page = self._parse_main_endpoints()
         return main_page.get(key, main_page)
 
-    @classmethod
-    def rate_limit(cls, key: str = None):
-        url = cls.joinurl(cls.GITHUB_API, "rate_limit")
-        response = cls.main_parser(url=url)
-
-        if key is None or not str_instance(key):
+    @hybridmethod
+    def rate_limit(obj, key: str = None):
+        # Unauthenticated (per IP) when called on the class.
+        headers = obj.MAIN_HEADERS if isinstance(obj, type) else obj._headers
+        auth = headers.get("Authorization", "")
+        fetched_at, response = obj._RATE_LIMIT_CACHE.get(auth, (0.0, None))
+        if response is None or time.monotonic() - fetched_at >= obj.RATE_LIMIT_TTL:
+            url = obj.joinurl(obj.GITHUB_API, "rate_limit")
+            response = obj._get(url, headers=headers)
+            if response:
+                obj._RATE_LIMIT_CACHE[auth] = (time.monotonic(), response)
+
+        if type(key) is not str:
             return response
 
         key = key.lower()
@@ -615,31 +1116,37 @@ class GitHubParser(APIParser):
             r = lambda x: response[main_keys[x]].get(key)
             return next(filter(bool, map(r, (0, 1))))
 
-    @cached_property
+    @property
     def branch(self) -> str:
         if self._branch:
             return self._branch
 
-    @cached_property
+    @property
     def full_stats(self):
         if self._repo_stats is None:
-            self._repo_stats = self._get_repo_stats()
+            if self._use_graphql:
+                self._repo_stats = self._get_repo_stats_graphql()
+            else:
+                self._repo_stats = self._get_repo_stats()
         return self._repo_stats
 
-    @cached_property
     @time_wrap
+    def _get_full_branch(self):
+        return self._thread_paths()
+
+    @property
     def full_branch(self):
         if self._full_branch is None:
-            self._full_branch = self._thread_paths()
+            self._full_branch = self._get_full_branch()
         return self._full_branch
 
-    @cached_property
+    @property
     def all_repos(self):
         if self._repos is None:
             self._repos = self._get_repositories()
         return self._repos
 
-    @cached_property
+    @property
     def all_repopaths(self):
         if self._repopaths is None:
             self._repopaths = self._get_repo_paths()
@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+
+from .type_hints import Union
+
+
+class RateLimiter:
+    """
+    A thread-safe limiter for outgoing GitHub API requests.
+
+    Caps the number of in-flight requests with a semaphore. It also tracks the
+    `X-RateLimit-Remaining` and `X-RateLimit-Reset` headers of each response. Once fewer
+    than `LOW_REMAINING` requests are left, new requests are spread evenly over the
+    rest of the window. When the quota runs out, they wait for the reset instead of
+    failing with `403`.
+    An optional token bucket enforces a local per-minute budget (e.g. the search API).
+
+    ### Parameters:
+        - `max_active`: The maximum number of concurrent requests.
+        - `per_minute`: The maximum number of requests per minute.
+            ~ If `None`, only the GitHub rate limit headers are honored.
+
+    ### Methods:
+        - `acquire` / `release`: Wait for (and free) a request slot.
+            ~ The limiter can also be used as a context manager.
+        - `wait_time`: The number of seconds to wait before the next request.
+            ~ Used by coroutines, which must not block on `acquire`.
+        - `update`: Records the rate limit headers of a response.
+        - `should_retry`: Whether a failed response is worth retrying.
+        - `retry_delay`: The number of seconds to wait before the next attempt.
+
+    ### Usage:
+        ```python
+        with get_rate_limiter(url) as limiter:
+            response = ...
+            limiter.update(response.headers)
+        ```
+    """
+
+    BACKOFF: tuple[int, ...] = (1, 2, 4, 8, 16, 32)
+    MAX_RETRIES: int = 5
+    LOW_REMAINING: int = 10
+    RETRY_STATUSES: frozenset[int] = frozenset({403, 429, 502, 503, 504})
+
+    def __init__(self, max_active: int = 10, per_minute: Union[int, None] = None):
+        self._semaphore = threading.BoundedSemaphore(max_active)
+        self._lock = threading.Lock()
+        self._remaining: Union[int, None] = None
+        self._reset: float = 0.0
+        self._next_at: float = 0.0
+        self._per_minute = per_minute
+        self._tokens = float(per_minute or 0)
+        self._refilled = time.monotonic()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def _take_token(self) -> float:
+        # Returns the time to wait for the next token (0 if one was taken).
+        now = time.monotonic()
+        rate = self._per_minute / 60
+        refill = (now - self._refilled) * rate
+        self._tokens = min(self._per_minute, self._tokens + refill)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / rate
+
+    def wait_time(self) -> float:
+        with self._lock:
+            now, remaining = time.time(), self._remaining
+            if remaining is not None and remaining < self.LOW_REMAINING:
+                if (window := self._reset - now) > 0:
+                    if not remaining:
+                        return window
+                    if (delay := self._next_at - now) > 0:
+                        return delay
+                    # Spread the remaining requests over the rest of the window.
+                    self._next_at = now + window / remaining
+            if self._per_minute:
+                return self._take_token()
+        return 0
+
+    def acquire(self):
+        while (delay := self.wait_time()) > 0:
+            time.sleep(delay)
+        self._semaphore.acquire()
+
+    def release(self):
+        self._semaphore.release()
+
+    def update(self, headers):
+        if not headers:
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                self._remaining = int(remaining)
+            if reset is not None:
+                self._reset = float(reset)
+
+    def should_retry(self, status: int, headers) -> bool:
+        if status not in self.RETRY_STATUSES:
+            return False
+        if status == 403:
+            # Only retry rate limited requests, not forbidden endpoints.
+            headers = headers or {}
+            return headers.get("X-RateLimit-Remaining") == "0" or (
+                "Retry-After" in headers
+            )
+        return True
+
+    def retry_delay(self, headers, attempt: int) -> float:
+        headers = headers or {}
+        if retry_after := headers.get("Retry-After"):
+            return float(retry_after)
+        if headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, float(headers.get("X-RateLimit-Reset", 0)) - time.time())
+        # Jittered, so concurrent retries do not hit the API in lockstep.
+        return self.BACKOFF[min(attempt, len(self.BACKOFF) - 1)] + random.random()
+
+
+RATE_LIMITER = RateLimiter(max_active=10)
+# The search API has a separate (much lower) limit of 30 requests per minute.
+SEARCH_RATE_LIMITER = RateLimiter(max_active=10, per_minute=30)
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    if "/search/" in url:
+        return SEARCH_RATE_LIMITER
+    return RATE_LIMITER
@@ -1,9 +1,26 @@
-import base64
 import inspect
 import operator
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from keyword import iskeyword
+from types import MethodType
 
-from .type_hints import Any, Callable, Generator, Union
+from .type_hints import Any, Callable, Generator, Iterable, Union
+
+try:
+    # SIMD accelerated, API compatible drop-in for `base64`.
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+try:
+    # The C field accessor used by `collections.namedtuple`.
+    from _collections import _tuplegetter
+except ImportError:
+
+    def _tuplegetter(index: int, doc: str):
+        return property(operator.itemgetter(index), doc=doc)
 
 
 class _Repr(dict):
@@ -24,55 +41,191 @@ class _Repr(dict):
         ```
     """
 
+    __slots__: tuple[str, ...] = ("_repr_cache",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._repr_cache = None
 
     def _format_value(self, str_obj) -> str:
         return f"<{type(str_obj).__name__}>"
 
     def __repr__(self) -> str:
-        return f"""{
-            {
-                k: {
-                    m: self._format_value(n)
-                    for m, n in v.items()
-                }
-                if isinstance(v, dict)
-                else self._format_value(v)
-                for k, v in self.items()
-            }
-        }"""
-
-
+        # Written in a single pass and cached until the dictionary is modified.
+        # (Changes made to nested dictionaries are not tracked.)
+        if self._repr_cache is None:
+            fmt = self._format_value
+            items = []
+            for k, v in self.items():
+                if isinstance(v, dict):
+                    inner = ", ".join(f"{m!r}: {fmt(n)!r}" for m, n in v.items())
+                    items.append(f"{k!r}: {{{inner}}}")
+                else:
+                    items.append(f"{k!r}: {fmt(v)!r}")
+            self._repr_cache = "{" + ", ".join(items) + "}"
+        return self._repr_cache
+
+
+def _clears_repr(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._repr_cache = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method in (
+    "__setitem__",
+    "__delitem__",
+    "__ior__",
+    "clear",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+):
+    setattr(_Repr, _method, _clears_repr(getattr(dict, _method)))
+
+
+@lru_cache(maxsize=8)
 def get_parameters(obj: Any, keys_only: bool = True) -> Union[dict, tuple[str]]:
     params = {k: v.default for k, v in inspect.signature(obj).parameters.items()}
     return [params, tuple(params.keys())][keys_only]
 
 
-def str_instance(obj: Any) -> bool:
-    return isinstance(obj, str)
+class hybridmethod:
+    """A method bound to the instance when called on one, otherwise to the class."""
 
+    __slots__: tuple[str, ...] = ("_func",)
 
-def decode_string(str_obj) -> str:
-    return base64.b64decode(str_obj).decode("utf-8")
+    def __init__(self, func: Callable):
+        self._func = func
 
+    def __get__(self, obj, objtype=None):
+        return MethodType(self._func, objtype if obj is None else obj)
+
+
+# GitHub wraps base64 contents at 60 columns.
+_NEWLINES = b"\n\r"
+
+
+def decode_string(str_obj: Union[str, bytes]) -> bytes:
+    # Returns the raw bytes; decoding to text is left to the caller.
+    if isinstance(str_obj, str):
+        str_obj = str_obj.encode("ascii")
+    return b64decode(str_obj.translate(None, _NEWLINES), validate=False)
+
+
+_SHARED_TPE: ThreadPoolExecutor = None
+_TPE_LOCK = threading.Lock()
+_TPE_MAX_WORKERS: int = 32
 
-def executor(func: Callable = None, *args, **kwargs) -> Union[Any, Generator]:
-    executor_type = kwargs.pop("executor_type", "tpe")
-    executor_only = kwargs.pop("executor_only", False)
-    cls_exec = [ProcessPoolExecutor, ThreadPoolExecutor][executor_type == "tpe"]
-    exec_kwargs = get_parameters(cls_exec, keys_only=False)
-    main_kwargs = {k: kwargs.pop(k, v) for k, v in exec_kwargs.items()}
-    new_executor = cls_exec(**main_kwargs)
 
-    if executor_only:
-        return new_executor
-    return yield_executor(cls_exec(**main_kwargs).map(func, *args, **kwargs))
+def _shared_executor() -> ThreadPoolExecutor:
+    # One thread pool reused by every call, rather than one (or two) per call.
+    global _SHARED_TPE
+    with _TPE_LOCK:
+        if _SHARED_TPE is None:
+            _SHARED_TPE = ThreadPoolExecutor(
+                max_workers=_TPE_MAX_WORKERS, thread_name_prefix="gh_parser"
+            )
+    return _SHARED_TPE
+
+
+def executor(func: Callable = None, *args, **kwargs) -> Union[Any, Generator]:
+    # The shared pool has a fixed size.
+    kwargs.pop("max_workers", None)
+    if kwargs.pop("executor_only", False):
+        return _shared_executor()
+    return yield_executor(_shared_executor().map(func, *args, **kwargs))
 
 
 def yield_executor(__executor) -> Generator:
     yield from __executor
 
 
+def fast_namedtuple(typename: str, field_names: Iterable[str]) -> type:
+    """
+    Build a `namedtuple`-like class without `exec`-ing a class template.
+
+    Invalid, duplicate, keyword or underscored field names are renamed to `_{index}`,
+    matching `namedtuple(..., rename=True)`.
+
+    ### Parameters:
+        - `typename`: The name of the new class.
+        - `field_names`: The names of the fields.
+
+    ### Returns:
+        - A `tuple` subclass with named field accessors and the `namedtuple` API:
+            ~ `_fields`, `_field_defaults`, `_make`, `_replace`, `_asdict` and
+            `__match_args__`.
+    """
+    fields, seen = [], set()
+    for index, name in enumerate(field_names):
+        if any(
+            (
+                not name.isidentifier(),
+                iskeyword(name),
+                name.startswith("_"),
+                name in seen,
+            )
+        ):
+            name = f"_{index}"
+        seen.add(name)
+        fields.append(name)
+    fields = tuple(fields)
+
+    def __new__(cls, *args, **kwargs):
+        if kwargs:
+            try:
+                args += tuple(kwargs.pop(f) for f in fields[len(args) :])
+            except KeyError as missing:
+                raise TypeError(f"{typename}() missing field {missing}") from None
+        if kwargs or len(args) != len(fields):
+            raise TypeError(f"{typename}() expects the fields {fields}")
+        return tuple.__new__(cls, args)
+
+    def __repr__(self) -> str:
+        return f"{typename}({', '.join(f'{f}={v!r}' for f, v in zip(fields, self))})"
+
+    def _asdict(self) -> dict:
+        return dict(zip(fields, self))
+
+    def __getnewargs__(self) -> tuple:
+        # Used by `copy` and `pickle` to rebuild the instance.
+        return tuple(self)
+
+    def _make(cls, iterable: Iterable):
+        result = tuple.__new__(cls, iterable)
+        if len(result) != len(fields):
+            raise TypeError(f"Expected {len(fields)} arguments, got {len(result)}")
+        return result
+
+    def _replace(self, **kwargs):
+        result = self._make(map(kwargs.pop, fields, self))
+        if kwargs:
+            raise ValueError(f"Got unexpected field names: {list(kwargs)!r}")
+        return result
+
+    namespace = {
+        "__slots__": (),
+        "_fields": fields,
+        "_field_defaults": {},
+        "__match_args__": fields,
+        "__new__": __new__,
+        "__repr__": __repr__,
+        "__getnewargs__": __getnewargs__,
+        "_asdict": _asdict,
+        "_make": classmethod(_make),
+        "_replace": _replace,
+    }
+    namespace.update(
+        (f, _tuplegetter(i, f"Alias for field number {i}"))
+        for i, f in enumerate(fields)
+    )
+    return type(typename, (tuple,), namespace)
+
+
 def diff_set(*args):
     return operator.sub(*map(set, args))
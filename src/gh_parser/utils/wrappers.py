@@ -10,7 +10,7 @@ VERBOSE_OUTPUTS = set()
 def time_wrap(func: Callable):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        func_name = func.__name__
+        func_name = func.__name__.removeprefix("_get_")
         if func_name == "full_branch":
             print(
                 f"Please be advised that the execution time for the {func_name!r} method"
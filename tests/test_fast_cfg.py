@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from gh_parser.utils.exceptions import ConfigException
+from gh_parser.utils.fast_cfg import fast_parse
+from gh_parser.utils.parsers import ConfigFileParser
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestFastParse(unittest.TestCase):
+    def assertMatchesConfigFileParser(self, path):
+        self.assertEqual(fast_parse(path), ConfigFileParser(path).config)
+
+    def test_setup_cfg(self):
+        self.assertMatchesConfigFileParser(ROOT / "setup.cfg")
+
+    def test_config_ini(self):
+        self.assertMatchesConfigFileParser(ROOT / "config.ini")
+
+    def test_continuation_lines_and_comments(self):
+        text = (
+            "# A comment\n"
+            "[Section]\n"
+            "Key = value\n"
+            "multi =\n"
+            "    first\n"
+            "    second\n"
+            "; another comment\n"
+            "other: x\n"
+            "\n"
+            "[empty]\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "test.cfg")
+            path.write_text(text)
+            self.assertMatchesConfigFileParser(path)
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "empty.cfg")
+            path.touch()
+            self.assertEqual(fast_parse(path), {})
+
+    def test_cache_invalidated_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "test.cfg")
+            path.write_text("[a]\nkey = 1\n")
+            self.assertEqual(fast_parse(path), {"a": {"key": "1"}})
+            path.write_text("[a]\nkey = 22\n")
+            self.assertEqual(fast_parse(path), {"a": {"key": "22"}})
+
+    def test_missing_file(self):
+        with self.assertRaises(ConfigException):
+            fast_parse(ROOT / "missing.cfg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import time
+import unittest
+
+from gh_parser.utils.rate_limit import (
+    RATE_LIMITER,
+    SEARCH_RATE_LIMITER,
+    RateLimiter,
+    get_rate_limiter,
+)
+
+
+class TestWaitTime(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter()
+
+    def update(self, remaining, reset_in):
+        self.limiter.update(
+            {
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(time.time() + reset_in),
+            }
+        )
+
+    def test_no_headers(self):
+        self.assertEqual(self.limiter.wait_time(), 0)
+
+    def test_plenty_remaining(self):
+        self.update(RateLimiter.LOW_REMAINING, 100)
+        self.assertEqual(self.limiter.wait_time(), 0)
+
+    def test_exhausted_waits_for_reset(self):
+        self.update(0, 100)
+        self.assertAlmostEqual(self.limiter.wait_time(), 100, delta=1)
+
+    def test_low_remaining_is_spread_over_window(self):
+        self.update(4, 100)
+        # The first request goes out, the next waits its share of the window.
+        self.assertEqual(self.limiter.wait_time(), 0)
+        self.assertAlmostEqual(self.limiter.wait_time(), 25, delta=1)
+
+    def test_past_reset(self):
+        self.update(0, -1)
+        self.assertEqual(self.limiter.wait_time(), 0)
+
+    def test_per_minute_budget(self):
+        limiter = RateLimiter(per_minute=2)
+        self.assertEqual(limiter.wait_time(), 0)
+        self.assertEqual(limiter.wait_time(), 0)
+        self.assertAlmostEqual(limiter.wait_time(), 30, delta=1)
+
+
+class TestShouldRetry(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter()
+
+    def test_retry_statuses(self):
+        for status in (429, 502, 503, 504):
+            with self.subTest(status=status):
+                self.assertTrue(self.limiter.should_retry(status, {}))
+
+    def test_other_statuses(self):
+        for status in (400, 401, 404, 422, 500):
+            with self.subTest(status=status):
+                self.assertFalse(self.limiter.should_retry(status, {}))
+
+    def test_forbidden(self):
+        should_retry = self.limiter.should_retry
+        self.assertFalse(should_retry(403, None))
+        self.assertFalse(should_retry(403, {"X-RateLimit-Remaining": "10"}))
+        self.assertTrue(should_retry(403, {"X-RateLimit-Remaining": "0"}))
+        self.assertTrue(should_retry(403, {"Retry-After": "5"}))
+
+    def test_retry_delay(self):
+        retry_delay = self.limiter.retry_delay
+        self.assertEqual(retry_delay({"Retry-After": "5"}, 0), 5)
+        reset = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": time.time() + 60}
+        self.assertAlmostEqual(retry_delay(reset, 0), 60, delta=1)
+        for attempt, backoff in enumerate(RateLimiter.BACKOFF):
+            with self.subTest(attempt=attempt):
+                self.assertTrue(backoff <= retry_delay({}, attempt) < backoff + 1)
+
+
+class TestGetRateLimiter(unittest.TestCase):
+    def test_search_endpoints(self):
+        url = "https://api.github.com/search/code?q=x"
+        self.assertIs(get_rate_limiter(url), SEARCH_RATE_LIMITER)
+        self.assertIs(get_rate_limiter("https://api.github.com/users/x"), RATE_LIMITER)
+
+
+if __name__ == "__main__":
+    unittest.main()
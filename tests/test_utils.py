@@ -0,0 +1,68 @@
+import copy
+import unittest
+from collections import namedtuple
+
+from gh_parser.utils.utils import fast_namedtuple
+
+
+class TestFastNamedtuple(unittest.TestCase):
+    def setUp(self):
+        self.Point = fast_namedtuple("Point", ("x", "y"))
+        self.point = self.Point(1, y=[2])
+
+    def test_matches_namedtuple(self):
+        expected = namedtuple("Point", ("x", "y"))(1, [2])
+        self.assertEqual(self.point, expected)
+        self.assertEqual(repr(self.point), repr(expected))
+        self.assertEqual(self.point._asdict(), expected._asdict())
+        self.assertEqual(self.Point._fields, ("x", "y"))
+        self.assertEqual(self.Point._field_defaults, {})
+        self.assertEqual(self.Point.__match_args__, ("x", "y"))
+        self.assertEqual((self.point.x, self.point.y), (1, [2]))
+
+    def test_renamed_fields(self):
+        names = ("ok", "class", "_private", "ok", "1x")
+        self.assertEqual(
+            fast_namedtuple("T", names)._fields,
+            namedtuple("T", names, rename=True)._fields,
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            self.Point(1)
+        with self.assertRaises(TypeError):
+            self.Point(1, 2, 3)
+        with self.assertRaises(TypeError):
+            self.Point(1, z=2)
+
+    def test_copy(self):
+        self.assertEqual(self.point.__getnewargs__(), (1, [2]))
+        shallow, deep = copy.copy(self.point), copy.deepcopy(self.point)
+        self.assertEqual(shallow, self.point)
+        self.assertIs(shallow.y, self.point.y)
+        self.assertEqual(deep, self.point)
+        self.assertIsNot(deep.y, self.point.y)
+        self.assertIsInstance(deep, self.Point)
+
+    def test_replace(self):
+        replaced = self.point._replace(y=3)
+        self.assertEqual(replaced, self.Point(1, 3))
+        self.assertIsInstance(replaced, self.Point)
+        with self.assertRaises(ValueError):
+            self.point._replace(z=3)
+
+    def test_make(self):
+        self.assertEqual(self.Point._make(iter((3, 4))), self.Point(3, 4))
+        with self.assertRaises(TypeError):
+            self.Point._make((3,))
+
+    def test_match(self):
+        match self.point:
+            case self.Point(x, y):
+                self.assertEqual((x, y), (1, [2]))
+            case _:
+                self.fail("positional pattern did not match")
+
+
+if __name__ == "__main__":
+    unittest.main()